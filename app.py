@@ -3,14 +3,44 @@ LogiParse - Logistics Invoice & Waybill Extractor.
 Supports PDF, PNG, and JPG via Gemini Vision — no text conversion needed.
 """
 
-import tempfile
+import asyncio
 import os
 import sys
-import json
+import orjson
 import streamlit as st
 
 sys.path.insert(0, os.path.dirname(__file__))
-from extractor import process_invoice
+from extractor import process_invoice, aprocess_invoice, has_invoice_content
+
+
+# Cache the whole pipeline keyed by document content, so clicking Extract
+# again on the same text or upload skips the Gemini round-trip entirely —
+# by far the dominant cost.
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_process_text(text: str, backend: str) -> dict:
+    return process_invoice(text, source_type="text", backend=backend)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_process_file(file_bytes: bytes, file_ext: str, source_type: str, backend: str) -> dict:
+    return process_invoice(file_bytes, source_type=source_type,
+                           file_ext=file_ext, backend=backend)
+
+
+async def _process_batch(payloads: list, backend: str) -> list:
+    # Overlap the network-bound Gemini calls instead of paying each one's
+    # latency in series; the semaphore keeps us under provider rate limits.
+    sem = asyncio.Semaphore(8)
+
+    async def one(file_bytes, file_ext):
+        async with sem:
+            source_type = "pdf" if file_ext == ".pdf" else "image"
+            return await aprocess_invoice(
+                file_bytes, source_type=source_type,
+                file_ext=file_ext, backend=backend)
+
+    return await asyncio.gather(
+        *(one(file_bytes, file_ext) for _, file_bytes, file_ext in payloads))
 
 
 # ─── Page Config ─────────────────────────────────────────────────────────────
@@ -127,7 +157,15 @@ with col_input:
         label_visibility="collapsed"
     )
 
-    raw_result = None
+    engine = st.radio(
+        "Extraction engine",
+        ["Gemini AI", "Offline (regex)"],
+        horizontal=True,
+        help="The offline engine needs no API key but only handles text and PDFs."
+    )
+    backend = "llm" if engine == "Gemini AI" else "regex"
+
+    results = []  # list of (label, pipeline result)
 
     if input_mode == "Paste Text":
         default_text = """LOGISTICS INVOICE
@@ -154,132 +192,160 @@ Total Amount: PHP 9,500.00"""
         )
 
         if st.button(" Extract & Validate"):
-            if text_input.strip():
+            if not text_input.strip():
+                st.error("Please paste some invoice text first.")
+            elif not has_invoice_content(text_input):
+                # Same gate the extractor applies — skip the spinner too.
+                st.warning("That doesn't look like an invoice — paste more of the document text.")
+            else:
                 # Corrected: Text mode doesn't need file_ext
                 with st.status("LogiParse AI is analyzing text...", expanded=True) as status:
                     st.write("🔍 Identifying document structure...")
-                    raw_result = process_invoice(text_input, source_type="text")
+                    results = [("Pasted Text", _cached_process_text(text_input, backend))]
                     
                     st.write("⚖️ Validating logistics data...")
                     status.update(label="Text Processed Successfully!", state="complete", expanded=False)
-            else:
-                st.error("Please paste some invoice text first.")
 
     else:
-        uploaded_file = st.file_uploader(
-            "Upload a PDF, PNG, or JPG invoice/waybill",
+        uploaded_files = st.file_uploader(
+            "Upload PDF, PNG, or JPG invoices/waybills",
             type=["pdf", "png", "jpg", "jpeg"],
+            accept_multiple_files=True,
             label_visibility="collapsed"
         )
 
-        if uploaded_file:
-            file_ext = os.path.splitext(uploaded_file.name)[1].lower()
-
-            if file_ext in [".png", ".jpg", ".jpeg"]:
-                st.image(uploaded_file, caption="Uploaded Image Preview", use_container_width=True)
-                uploaded_file.seek(0)
+        if uploaded_files:
+            if len(uploaded_files) == 1:
+                only = uploaded_files[0]
+                if os.path.splitext(only.name)[1].lower() in [".png", ".jpg", ".jpeg"]:
+                    st.image(only, caption="Uploaded Image Preview", use_container_width=True)
+                    only.seek(0)
 
-            st.success(f"✅ Loaded: {uploaded_file.name}")
+            st.success(f"✅ Loaded: {', '.join(f.name for f in uploaded_files)}")
 
             if st.button(" Extract & Validate"):
-                source_type = "pdf" if file_ext == ".pdf" else "image"
-
-                with tempfile.NamedTemporaryFile(delete=False, suffix=file_ext) as tmp:
-                    tmp.write(uploaded_file.read())
-                    tmp_path = tmp.name
-
-                with st.status(f"LogiParse AI is reading your {file_ext.upper()[1:]}...", expanded=True) as status:
+                payloads = [
+                    (f.name, f.getvalue(), os.path.splitext(f.name)[1].lower())
+                    for f in uploaded_files
+                ]
+
+                if backend == "regex" and any(ext != ".pdf" for _, _, ext in payloads):
+                    st.error("The offline engine only reads PDFs — switch to Gemini AI for images.")
+                    st.stop()
+
+                label = (f"LogiParse AI is reading your {payloads[0][2].upper()[1:]}..."
+                         if len(payloads) == 1
+                         else f"LogiParse AI is reading {len(payloads)} documents...")
+                with st.status(label, expanded=True) as status:
                     st.write("📂 Scanning document layers...")
-                    raw_result = process_invoice(tmp_path, source_type=source_type)
-                    
-                    st.write("⚖️ Validating logistics data...")
-                    status.update(label="File Processed Successfully!", state="complete", expanded=False)
+                    if len(payloads) == 1:
+                        name, file_bytes, file_ext = payloads[0]
+                        source_type = "pdf" if file_ext == ".pdf" else "image"
+                        results = [(name, _cached_process_file(file_bytes, file_ext, source_type, backend))]
+                    else:
+                        # Batch mode: run all the Gemini calls concurrently.
+                        batch = asyncio.run(_process_batch(payloads, backend))
+                        results = [(name, res) for (name, _, _), res in zip(payloads, batch)]
 
-                os.unlink(tmp_path)
+                    st.write("⚖️ Validating logistics data...")
+                    status.update(label="Files Processed Successfully!", state="complete", expanded=False)
 
 # ─── Results Section ─────────────────────────────────────────────────────────
-with col_results:
-    if raw_result:
-        data = raw_result["extracted_data"]
-        validation = raw_result["validation_report"]
-        meta = raw_result["metadata"]
-
-        st.markdown("### Extracted Fields")
-
-        def field_card(label, value):
-            val_html = f'<div class="field-value">{value}</div>' if value else '<div class="field-missing">Not detected</div>'
+def render_result(raw_result, key):
+    data = raw_result["extracted_data"]
+    validation = raw_result["validation_report"]
+    meta = raw_result["metadata"]
+
+    st.markdown("### Extracted Fields")
+
+    def field_card(label, value):
+        val_html = f'<div class="field-value">{value}</div>' if value else '<div class="field-missing">Not detected</div>'
+        st.markdown(f"""
+        <div class="field-card">
+            <div class="field-label">{label}</div>
+            {val_html}
+        </div>
+        """, unsafe_allow_html=True)
+
+    col_a, col_b = st.columns(2)
+    with col_a:
+        field_card("Invoice Number", data.get("invoice_number"))
+        field_card("Sender", data.get("sender"))
+        field_card("Total Weight", data.get("total_weight"))
+    with col_b:
+        field_card("Date", data.get("date"))
+        field_card("Receiver", data.get("receiver"))
+        amt = data.get("total_amount")
+        cur = data.get("currency", "PHP")
+        field_card("Total Amount", f"{cur} {amt}" if amt else None)
+
+    if data.get("tracking_number"):
+        field_card("Tracking Number", data["tracking_number"])
+
+    if data.get("items"):
+        st.markdown("**Line Items**")
+        for item in data["items"]:
             st.markdown(f"""
-            <div class="field-card">
-                <div class="field-label">{label}</div>
-                {val_html}
+            <div class="item-row">
+                <span>{item['description']}</span>
+                <span>Qty: {item['quantity']}</span>
+                <span>Unit: {item['unit_price']}</span>
+                <span><strong>{item['line_total']}</strong></span>
             </div>
             """, unsafe_allow_html=True)
 
-        col_a, col_b = st.columns(2)
-        with col_a:
-            field_card("Invoice Number", data.get("invoice_number"))
-            field_card("Sender", data.get("sender"))
-            field_card("Total Weight", data.get("total_weight"))
-        with col_b:
-            field_card("Date", data.get("date"))
-            field_card("Receiver", data.get("receiver"))
-            amt = data.get("total_amount")
-            cur = data.get("currency", "PHP")
-            field_card("Total Amount", f"{cur} {amt}" if amt else None)
-
-        if data.get("tracking_number"):
-            field_card("Tracking Number", data["tracking_number"])
-
-        if data.get("items"):
-            st.markdown("**Line Items**")
-            for item in data["items"]:
-                st.markdown(f"""
-                <div class="item-row">
-                    <span>{item['description']}</span>
-                    <span>Qty: {item['quantity']}</span>
-                    <span>Unit: {item['unit_price']}</span>
-                    <span><strong>{item['line_total']}</strong></span>
-                </div>
-                """, unsafe_allow_html=True)
-
-        st.markdown('<hr class="divider">', unsafe_allow_html=True)
-
-        st.markdown("### Validation Report")
-        status = validation["status"]
-        status_class = "status-pass" if "PASS" in status else "status-fail"
-        st.markdown(f'<div class="{status_class}">{status}</div>', unsafe_allow_html=True)
-        st.markdown(f'<div class="coverage-badge"> {validation["field_coverage"]}</div>', unsafe_allow_html=True)
-
-        if validation.get("issues"):
-            st.markdown("<br>", unsafe_allow_html=True)
-            for issue in validation["issues"]:
-                st.markdown(f'<div class="issue-item">{issue}</div>', unsafe_allow_html=True)
-
-        if validation.get("warnings"):
-            for warning in validation["warnings"]:
-                st.markdown(f'<div class="warning-item">{warning}</div>', unsafe_allow_html=True)
-
-        st.markdown('<hr class="divider">', unsafe_allow_html=True)
-
-        st.markdown("### Structured Output (JSON)")
-        export_data = {
-            "extracted_data": {k: v for k, v in data.items() if k != "raw_text_preview"},
-            "validation_report": validation,
-            "metadata": meta
-        }
-        json_str = json.dumps(export_data, indent=2)
-        st.code(json_str, language="json")
-        st.download_button(
-            label="⬇️ Download JSON",
-            data=json_str,
-            file_name="extracted_invoice.json",
-            mime="application/json"
-        )
+    st.markdown('<hr class="divider">', unsafe_allow_html=True)
 
+    st.markdown("### Validation Report")
+    status = validation["status"]
+    status_class = "status-pass" if "PASS" in status else "status-fail"
+    st.markdown(f'<div class="{status_class}">{status}</div>', unsafe_allow_html=True)
+    st.markdown(f'<div class="coverage-badge"> {validation["field_coverage"]}</div>', unsafe_allow_html=True)
+
+    if validation.get("issues"):
+        st.markdown("<br>", unsafe_allow_html=True)
+        for issue in validation["issues"]:
+            st.markdown(f'<div class="issue-item">{issue}</div>', unsafe_allow_html=True)
+
+    if validation.get("warnings"):
+        for warning in validation["warnings"]:
+            st.markdown(f'<div class="warning-item">{warning}</div>', unsafe_allow_html=True)
+
+    st.markdown('<hr class="divider">', unsafe_allow_html=True)
+
+    st.markdown("### Structured Output (JSON)")
+    export_data = {
+        "extracted_data": {k: v for k, v in data.items() if k != "raw_text_preview"},
+        "validation_report": validation,
+        "metadata": meta
+    }
+    # orjson serializes in C — matters when an LLM reply runs to dozens
+    # of KB and this re-renders on every widget interaction.
+    json_str = orjson.dumps(export_data, option=orjson.OPT_INDENT_2).decode()
+    st.code(json_str, language="json")
+    st.download_button(
+        label="⬇️ Download JSON",
+        data=json_str,
+        file_name="extracted_invoice.json",
+        mime="application/json",
+        key=f"download_{key}"
+    )
+
+
+with col_results:
+    if results:
+        if len(results) == 1:
+            render_result(results[0][1], results[0][0])
+        else:
+            # One tab per uploaded document in batch mode.
+            tabs = st.tabs([name for name, _ in results])
+            for tab, (name, res) in zip(tabs, results):
+                with tab:
+                    render_result(res, name)
     else:
         st.markdown("### Extracted Fields")
         st.markdown("""
         <div style="color:#484f58; padding: 60px 20px; text-align:center; font-family:'Space Mono',monospace; font-size:0.85rem; border: 1px dashed #30363d; border-radius:10px;">
             Paste invoice text or upload a PDF / PNG / JPG<br>then click Extract & Validate
         </div>
-        """, unsafe_allow_html=True)
\ No newline at end of file
+        """, unsafe_allow_html=True)
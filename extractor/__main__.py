@@ -0,0 +1,29 @@
+"""CLI demo: python -m extractor [llm|regex]"""
+
+import sys
+
+import orjson
+
+from . import process_invoice
+
+if __name__ == "__main__":
+    backend = sys.argv[1] if len(sys.argv) > 1 else "llm"
+
+    sample = """
+    LOGISTICS INVOICE
+    Invoice No: INV-2024-00892
+    Date: February 20, 2024
+    Tracking No: TRK-PH-44821
+
+    From: ABC Warehousing Corp., Mandaue City, Cebu
+    To: XYZ Retail Store, Makati City, Metro Manila
+
+    Industrial Fan Motor     2    1500.00    3000.00
+    Conveyor Belt Segment    5     800.00    4000.00
+    Safety Gloves (box)     10     250.00    2500.00
+
+    Total Weight: 45.5 kg
+    Total Amount: PHP 9,500.00
+    """
+    result = process_invoice(sample, source_type="text", backend=backend)
+    print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
@@ -0,0 +1,46 @@
+"""Shared pieces used by both extraction backends."""
+
+# Maps file extensions to MIME types Gemini understands
+MIME_TYPES = {
+    ".pdf": "application/pdf",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+}
+
+# Strips thousands separators, currency marks, and stray spaces before
+# float() in one C-level scan — one pass with a lookup table instead of a
+# chain of .replace() calls.
+_NUM_TABLE = str.maketrans("", "", ",₱$ ")
+
+
+def _preview(text: str) -> str:
+    # Slice the preview up front: the result dict can outlive the call
+    # (Streamlit caches it for the whole session), and it shouldn't keep
+    # a multi-MB paste alive just for its first 300 characters.
+    return text[:300] + ("..." if len(text) > 300 else "")
+
+
+def has_invoice_content(text: str) -> bool:
+    """
+    Cheap gate before the Gemini call: a real invoice always carries
+    digits and more than a line of text, so tiny or number-free pastes
+    can't yield anything worth a network round-trip.
+    """
+    return len(text.strip()) >= 40 and any(c.isdigit() for c in text)
+
+
+def _empty_result(preview: str) -> dict:
+    """Return a blank result when extraction fails."""
+    return {
+        "invoice_number": None,
+        "date": None,
+        "sender": None,
+        "receiver": None,
+        "total_weight": None,
+        "total_amount": None,
+        "currency": None,
+        "items": [],
+        "tracking_number": None,
+        "raw_text_preview": preview
+    }
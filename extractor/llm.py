@@ -0,0 +1,203 @@
+"""Gemini backend — text and vision extraction through one shared model."""
+
+import os
+from typing import List, Optional
+
+from pydantic import BaseModel, ValidationError
+
+from .common import MIME_TYPES, _empty_result, _preview, has_invoice_content
+
+
+class LineItem(BaseModel):
+    description: Optional[str] = None
+    quantity: Optional[float] = None
+    unit_price: Optional[str] = None
+    line_total: Optional[str] = None
+
+
+class Invoice(BaseModel):
+    """Response schema Gemini is constrained to — guarantees valid JSON."""
+    invoice_number: Optional[str] = None
+    date: Optional[str] = None
+    sender: Optional[str] = None
+    receiver: Optional[str] = None
+    total_weight: Optional[str] = None
+    total_amount: Optional[str] = None
+    currency: Optional[str] = None
+    tracking_number: Optional[str] = None
+    items: List[LineItem] = []
+
+
+# Filled in by _get_model() on first use.
+_MODEL = None
+
+
+def _get_model():
+    """
+    Import and configure the Gemini SDK on first use, then keep one model
+    handle for the whole process. Streamlit re-executes the script on
+    every widget interaction, so deferring the SDK import (and dotenv)
+    trims cold start, and sessions that only use the offline regex path
+    never pay for it at all. JSON mode means the response is schema-valid
+    JSON with no markdown fences, so no cleanup pass is needed before
+    parsing.
+    """
+    global _MODEL
+    if _MODEL is None:
+        from dotenv import load_dotenv
+        import google.generativeai as genai
+
+        load_dotenv()
+        genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+        _MODEL = genai.GenerativeModel(
+            "gemini-2.5-flash",
+            generation_config={
+                "response_mime_type": "application/json",
+                "response_schema": Invoice,
+            },
+        )
+    return _MODEL
+
+
+EXTRACTION_PROMPT = """You are an expert logistics data extractor.
+Look at this document (it may be a scanned image, photo, or PDF of an invoice or waybill).
+Extract all the relevant fields into the JSON response schema.
+If a field is missing or unreadable, return null for that field.
+
+Required keys:
+- invoice_number
+- date
+- sender
+- receiver
+- total_weight (include unit, e.g. '45.5 kg')
+- total_amount (numbers only, no commas or currency symbols)
+- currency (e.g. PHP, USD)
+- tracking_number
+- items (list of objects with keys: description, quantity, unit_price, line_total)
+"""
+
+
+def _file_parts(source, file_ext=None):
+    """
+    Resolve a path-or-bytes source into Gemini content parts plus the
+    extension (for the preview label). Shared by the sync and async paths.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        file_bytes = bytes(source)
+        ext = (file_ext or "").lower()
+    else:
+        ext = os.path.splitext(source)[1].lower()
+        with open(source, "rb") as f:
+            file_bytes = f.read()
+
+    mime_type = MIME_TYPES.get(ext)
+    if not mime_type:
+        raise ValueError(f"Unsupported file type: {ext}")
+
+    # The SDK takes raw bytes and handles any wire encoding itself —
+    # no need to base64-inflate the payload by a third first.
+    return [{"mime_type": mime_type, "data": file_bytes}, EXTRACTION_PROMPT], ext
+
+
+_REPROMPT = ("Your last output failed validation: {err}\n"
+             "Return only valid JSON matching the schema.")
+
+
+def _validate_or_reprompt(response, request_parts) -> Invoice:
+    """
+    Parse the model reply; if it fails schema validation, spend one
+    targeted follow-up pointing at the error instead of discarding the
+    expensive extraction and making the user rerun it.
+    """
+    try:
+        return Invoice.model_validate_json(response.text)
+    except ValidationError as err:
+        retry = _get_model().generate_content(
+            list(request_parts) + [response.text, _REPROMPT.format(err=err)])
+        return Invoice.model_validate_json(retry.text)
+
+
+async def _avalidate_or_reprompt(response, request_parts) -> Invoice:
+    """Async twin of _validate_or_reprompt."""
+    try:
+        return Invoice.model_validate_json(response.text)
+    except ValidationError as err:
+        retry = await _get_model().generate_content_async(
+            list(request_parts) + [response.text, _REPROMPT.format(err=err)])
+        return Invoice.model_validate_json(retry.text)
+
+
+def _finish_result(invoice: Invoice, preview: str) -> dict:
+    result = invoice.model_dump()
+    result["raw_text_preview"] = preview
+    return result
+
+
+def parse_invoice_from_file(source, file_ext: str = None) -> dict:
+    """
+    Send a file (PDF, PNG, JPG) directly to Gemini for extraction.
+    Gemini reads it natively — no text conversion needed.
+    Accepts a filesystem path, or the raw bytes of an upload plus its
+    extension — uploads never touch the disk.
+    """
+    parts, ext = _file_parts(source, file_ext)
+    try:
+        response = _get_model().generate_content(parts)
+        return _finish_result(
+            _validate_or_reprompt(response, parts),
+            f"[Extracted from {ext.upper()} file via Gemini Vision]")
+
+    except Exception as e:
+        print(f"AI extraction failed: {e}")
+        return _empty_result(f"Extraction failed: {e}")
+
+
+async def aparse_invoice_from_file(source, file_ext: str = None) -> dict:
+    """Async twin of parse_invoice_from_file, for batch uploads."""
+    parts, ext = _file_parts(source, file_ext)
+    try:
+        response = await _get_model().generate_content_async(parts)
+        return _finish_result(
+            await _avalidate_or_reprompt(response, parts),
+            f"[Extracted from {ext.upper()} file via Gemini Vision]")
+
+    except Exception as e:
+        print(f"AI extraction failed: {e}")
+        return _empty_result(f"Extraction failed: {e}")
+
+
+def parse_invoice_from_text(text: str) -> dict:
+    """
+    Send plain pasted text to Gemini for extraction.
+    """
+    if not has_invoice_content(text):
+        return _empty_result("No invoice content detected — input too short or has no numbers")
+
+    preview = _preview(text)
+    try:
+        # The instructions and the document go as separate content parts:
+        # no per-call copy of the static block into a new string, and
+        # Gemini can prefix-cache the part that never changes.
+        response = _get_model().generate_content([EXTRACTION_PROMPT, text])
+        return _finish_result(
+            _validate_or_reprompt(response, [EXTRACTION_PROMPT, text]), preview)
+
+    except Exception as e:
+        print(f"AI extraction failed: {e}")
+        return _empty_result(f"Extraction failed: {e}")
+
+
+async def aparse_invoice_from_text(text: str) -> dict:
+    """Async twin of parse_invoice_from_text, for batch uploads."""
+    if not has_invoice_content(text):
+        return _empty_result("No invoice content detected — input too short or has no numbers")
+
+    preview = _preview(text)
+    try:
+        response = await _get_model().generate_content_async([EXTRACTION_PROMPT, text])
+        return _finish_result(
+            await _avalidate_or_reprompt(response, [EXTRACTION_PROMPT, text]), preview)
+
+    except Exception as e:
+        print(f"AI extraction failed: {e}")
+        return _empty_result(f"Extraction failed: {e}")
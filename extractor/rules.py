@@ -0,0 +1,81 @@
+"""Offline regex backend — no API key, no network round-trip."""
+
+try:
+    # RE2 runs our patterns in linear time with no backtracking, so a
+    # pathological paste can't blow up the parse step. Same API, so it is a
+    # drop-in when installed; otherwise the stdlib engine is used.
+    import re2 as re
+except ImportError:
+    import re
+
+from .common import _NUM_TABLE, _empty_result, _preview
+
+# Field patterns for the offline regex parser. Each one carries a named group
+# matching its result key, so they can be merged into a single alternation and
+# the whole text scanned once instead of once per field. Compiled at import —
+# no per-call compile-cache lookups.
+_FIELD_PATTERNS = {
+    "invoice_number": r"invoice\s*(?:no\.?|number|num|#)[:\s#]*(?P<invoice_number>[A-Z0-9][A-Z0-9\-/]*)",
+    "tracking_number": r"tracking\s*(?:no\.?|number|#)?[:\s#]*(?P<tracking_number>[A-Z0-9][A-Z0-9\-]*)",
+    "date": r"\bdate\s*:\s*(?P<date>[^\n]+)",
+    "sender": r"\b(?:from|sender|shipper)\s*:\s*(?P<sender>[^\n]+)",
+    "receiver": r"\b(?:to|receiver|consignee)\s*:\s*(?P<receiver>[^\n]+)",
+    "total_weight": r"total\s*weight\s*:\s*(?P<total_weight>[\d,\.]+\s*(?:kgs?|lbs?|tons?|g)?)",
+    "total_amount": r"total\s*(?:amount|due)\s*:\s*(?:(?P<currency>[A-Z]{3}|[₱$])\s*)?(?P<total_amount>[\d,\.]+)",
+}
+_FIELDS_RE = re.compile("|".join(_FIELD_PATTERNS.values()), re.IGNORECASE)
+
+
+def _is_number(token: str) -> bool:
+    try:
+        float(token.translate(_NUM_TABLE))
+    except ValueError:
+        return False
+    return True
+
+
+def _scan_line_items(text: str) -> list:
+    """
+    Regex-free line-item scan: split each line on whitespace, peel off the
+    three trailing numeric columns (qty, unit price, line total), and keep
+    the rest as the description. Same grammar the old findall pattern
+    matched, but a straight O(N) tokenizer walk with no backtracking —
+    line items dominate on long tabular pastes.
+    """
+    items = []
+    for line in text.splitlines():
+        parts = line.split()
+        if len(parts) < 4:
+            continue
+        qty, unit_price, line_total = parts[-3:]
+        if not qty.isdigit():
+            continue
+        if not (_is_number(unit_price) and _is_number(line_total)):
+            continue
+        description = " ".join(parts[:-3])
+        if not description[:1].isalpha():
+            continue
+        items.append({
+            "description": description,
+            "quantity": qty,
+            "unit_price": unit_price,
+            "line_total": line_total,
+        })
+    return items
+
+
+def parse_invoice(text: str) -> dict:
+    """
+    Extract invoice fields with regexes only — works offline, no API call.
+    One finditer pass over the combined pattern fills the scalar fields;
+    line items are collected by the tokenizer pass because they repeat.
+    """
+    result = _empty_result(_preview(text))
+
+    for m in _FIELDS_RE.finditer(text):
+        for field, value in m.groupdict().items():
+            if value is not None and result.get(field) is None:
+                result[field] = value.strip()
+
+    result["items"] = _scan_line_items(text)
+    return result
@@ -0,0 +1,89 @@
+"""Validation checks shared by every extraction backend."""
+
+from .common import _NUM_TABLE
+
+# Below this many line items, NumPy's per-call overhead outweighs the
+# vectorized math; the plain loop wins.
+_VECTOR_THRESHOLD = 16
+
+
+def _validate_items_scalar(items: list) -> list:
+    issues = []
+    for item in items:
+        try:
+            calc = float(item["quantity"]) * float(str(item["unit_price"]).translate(_NUM_TABLE))
+            stated = float(str(item["line_total"]).translate(_NUM_TABLE))
+            if abs(calc - stated) > 0.5:
+                issues.append(
+                    f"❌ Line item '{item['description']}': "
+                    f"Qty × UnitPrice ({calc:.2f}) ≠ LineTotal ({stated:.2f})"
+                )
+        except (ValueError, KeyError, TypeError):
+            pass
+    return issues
+
+
+def _validate_items_vector(items: list) -> list:
+    """
+    NumPy path for invoices with many line items: three array ops replace
+    per-row float()/abs() interpreter work. Any malformed row (or a missing
+    numpy) drops the whole batch back to the scalar loop.
+    """
+    try:
+        import numpy as np
+        qs = np.fromiter((float(i["quantity"]) for i in items),
+                         dtype=np.float64, count=len(items))
+        ups = np.fromiter((float(str(i["unit_price"]).translate(_NUM_TABLE)) for i in items),
+                          dtype=np.float64, count=len(items))
+        lts = np.fromiter((float(str(i["line_total"]).translate(_NUM_TABLE)) for i in items),
+                          dtype=np.float64, count=len(items))
+    except (ImportError, ValueError, KeyError, TypeError):
+        return _validate_items_scalar(items)
+
+    calc = qs * ups
+    return [
+        f"❌ Line item '{items[idx]['description']}': "
+        f"Qty × UnitPrice ({calc[idx]:.2f}) ≠ LineTotal ({lts[idx]:.2f})"
+        for idx in np.flatnonzero(np.abs(calc - lts) > 0.5)
+    ]
+
+
+def validate_extracted_data(data: dict) -> dict:
+    """
+    Run validation checks on extracted fields.
+    """
+    issues = []
+    warnings = []
+
+    if not data.get("invoice_number"):
+        issues.append("❌ Invoice number not found")
+    if not data.get("date"):
+        warnings.append("⚠️  Date not detected — may be missing or unusual format")
+    if not data.get("sender"):
+        warnings.append("⚠️  Sender/Shipper not found")
+    if not data.get("receiver"):
+        warnings.append("⚠️  Receiver/Consignee not found")
+    if not data.get("total_amount"):
+        issues.append("❌ Total amount not found")
+    else:
+        try:
+            val = float(str(data["total_amount"]).translate(_NUM_TABLE))
+            if val <= 0:
+                issues.append("❌ Total amount is zero or negative — suspicious")
+        except ValueError:
+            issues.append("❌ Total amount is not a valid number")
+
+    items = data.get("items", [])
+    if len(items) >= _VECTOR_THRESHOLD:
+        issues.extend(_validate_items_vector(items))
+    else:
+        issues.extend(_validate_items_scalar(items))
+
+    status = "PASS ✅" if not issues else "FAIL ❌"
+
+    return {
+        "status": status,
+        "issues": issues,
+        "warnings": warnings,
+        "field_coverage": f"{sum(1 for v in [data.get('invoice_number'), data.get('date'), data.get('sender'), data.get('receiver'), data.get('total_amount')] if v)}/5 key fields extracted"
+    }